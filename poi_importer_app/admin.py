@@ -13,3 +13,5 @@ class PoIAdmin(admin.ModelAdmin):
 	list_display = ('id', 'name', 'poi_id', 'category', 'avg_rating')
 	search_fields = ('id__exact', 'poi_id__exact')
 	list_filter = ('category',)
+	# skip the extra unfiltered COUNT(*) per change-list render on large tables
+	show_full_result_count = False
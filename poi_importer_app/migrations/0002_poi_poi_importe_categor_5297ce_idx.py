@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-29 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poi_importer_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poi',
+            index=models.Index(fields=['category'], name='poi_importe_categor_5297ce_idx'),
+        ),
+    ]
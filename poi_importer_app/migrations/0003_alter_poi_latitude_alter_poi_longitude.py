@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-08-29 10:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poi_importer_app', '0002_poi_poi_importe_categor_5297ce_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='poi',
+            name='latitude',
+            field=models.FloatField(),
+        ),
+        migrations.AlterField(
+            model_name='poi',
+            name='longitude',
+            field=models.FloatField(),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-08-29 10:57
+
+from django.db import migrations
+import poi_importer_app.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('poi_importer_app', '0003_alter_poi_latitude_alter_poi_longitude'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='poi',
+            name='ratings',
+            field=poi_importer_app.models.FastJSONField(),
+        ),
+    ]
@@ -1,18 +1,40 @@
 from django.db import models
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONField(models.JSONField):
+    """JSONField that serializes with orjson when it is installed."""
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if (
+            orjson is None
+            or self.encoder is not None
+            or value is None
+            or hasattr(value, 'as_sql')
+        ):
+            return super().get_db_prep_value(value, connection, prepared)
+        # already-serialized JSON text; the DB casts it to the column type
+        return orjson.dumps(value).decode()
+
+
 class PoI(models.Model):
     poi_id = models.BigIntegerField(unique=True)
     name = models.CharField(max_length=255)
     category = models.CharField(max_length=255)
-    latitude = models.DecimalField(max_digits=10, decimal_places=7)
-    longitude = models.DecimalField(max_digits=10, decimal_places=7)
-    ratings = models.JSONField() 
+    latitude = models.FloatField()
+    longitude = models.FloatField()
+    ratings = FastJSONField()
     avg_rating = models.FloatField(null=True, blank=True)
 
-    def save(self, *args, **kwargs):
-        if self.ratings:
-            self.avg_rating = sum(self.ratings) / len(self.ratings)
-        super().save(*args, **kwargs)
+    class Meta:
+        indexes = [
+            # the admin sidebar filters on category
+            models.Index(fields=['category']),
+        ]
 
     def __str__(self):
-        return f"PoI Record: {', '.join(f'{key}: {value}' for key, value in vars(self).items())}"
\ No newline at end of file
+        return f"PoI({self.poi_id}: {self.name})"
\ No newline at end of file